@@ -2,11 +2,366 @@
 """
 Generate detailed HTML report from k6 test results
 """
+import gzip
+import hashlib
 import json
 import os
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import brotli
+except ImportError:  # Optional: only gzip copies are written without it
+    brotli = None
+
+# Extensions that get precompressed .gz/.br siblings for the static host
+COMPRESSIBLE_SUFFIXES = {'.html', '.css', '.js', '.json'}
+
+# Failed-request drilldown: time bucket width and number of combinations listed
+ERROR_BUCKET_SECONDS = 10
+ERROR_TOP_COMBINATIONS = 25
+
+# Shared stylesheet for the overview and detail pages, written once as a hashed asset
+REPORT_CSS = """
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+    padding: 20px;
+}
+.container {
+    max-width: 1400px;
+    margin: 0 auto;
+    background: white;
+    border-radius: 16px;
+    box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+    overflow: hidden;
+}
+.header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 40px;
+}
+.header h1 {
+    font-size: 2.5em;
+    margin-bottom: 10px;
+    font-weight: 700;
+}
+.header .subtitle {
+    font-size: 1.1em;
+    opacity: 0.9;
+}
+.back-link {
+    display: inline-block;
+    color: white;
+    text-decoration: none;
+    margin-bottom: 20px;
+    opacity: 0.9;
+}
+.back-link:hover {
+    opacity: 1;
+}
+.timestamp {
+    background: rgba(255,255,255,0.2);
+    padding: 10px 20px;
+    border-radius: 8px;
+    margin-top: 20px;
+    display: inline-block;
+}
+.stats-overview {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    padding: 40px;
+    background: #f8f9fa;
+}
+.stats-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    margin-bottom: 30px;
+}
+.stat-card {
+    background: white;
+    padding: 25px;
+    border-radius: 12px;
+    text-align: center;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+}
+.stat-value {
+    font-size: 2.5em;
+    font-weight: 700;
+    color: #667eea;
+    margin-bottom: 5px;
+}
+.stat-label {
+    color: #666;
+    font-size: 0.9em;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+.content {
+    padding: 40px;
+}
+.section {
+    margin-bottom: 40px;
+}
+.section-title {
+    font-size: 1.8em;
+    color: #333;
+    margin-bottom: 25px;
+    font-weight: 600;
+}
+.test-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(400px, 1fr));
+    gap: 25px;
+    margin-bottom: 40px;
+}
+.test-card {
+    background: white;
+    border: 2px solid #e0e0e0;
+    border-radius: 12px;
+    padding: 25px;
+    transition: all 0.3s ease;
+}
+.test-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 8px 20px rgba(0,0,0,0.15);
+}
+.test-card.success {
+    border-color: #10b981;
+}
+.test-card.warning {
+    border-color: #f59e0b;
+}
+.test-card.error {
+    border-color: #ef4444;
+}
+.test-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 20px;
+}
+.test-header h3 {
+    font-size: 1.3em;
+    color: #333;
+}
+.status-badge {
+    padding: 6px 12px;
+    border-radius: 20px;
+    font-size: 0.85em;
+    font-weight: 600;
+}
+.status-badge.success {
+    background: #d1fae5;
+    color: #065f46;
+}
+.status-badge.warning {
+    background: #fef3c7;
+    color: #92400e;
+}
+.status-badge.error {
+    background: #fee2e2;
+    color: #991b1b;
+}
+.test-metrics {
+    display: grid;
+    grid-template-columns: repeat(3, 1fr);
+    gap: 15px;
+    margin-bottom: 15px;
+}
+.metric {
+    text-align: center;
+    padding: 10px;
+    background: #f8f9fa;
+    border-radius: 8px;
+}
+.metric-label {
+    display: block;
+    font-size: 0.75em;
+    color: #666;
+    margin-bottom: 5px;
+    text-transform: uppercase;
+}
+.metric-value {
+    display: block;
+    font-size: 1.3em;
+    font-weight: 700;
+    color: #333;
+}
+.details-link {
+    display: inline-block;
+    margin-top: 10px;
+    color: #667eea;
+    text-decoration: none;
+    font-weight: 600;
+}
+.details-link:hover {
+    text-decoration: underline;
+}
+table {
+    width: 100%;
+    border-collapse: collapse;
+    background: white;
+    border-radius: 8px;
+    overflow: hidden;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+}
+th {
+    background: #667eea;
+    color: white;
+    padding: 15px;
+    text-align: left;
+    font-weight: 600;
+}
+td {
+    padding: 12px 15px;
+    border-bottom: 1px solid #e0e0e0;
+}
+td.empty {
+    text-align: center;
+    color: #999;
+}
+tr:last-child td {
+    border-bottom: none;
+}
+tr:hover {
+    background: #f8f9fa;
+}
+.lazy-section > summary {
+    cursor: pointer;
+    list-style-position: inside;
+}
+.lazy-section > summary .section-title {
+    display: inline;
+}
+.lazy-section[open] > summary {
+    margin-bottom: 20px;
+}
+.lazy-status {
+    color: #999;
+}
+.footer {
+    background: #f8f9fa;
+    padding: 30px;
+    text-align: center;
+    color: #666;
+    border-top: 1px solid #e0e0e0;
+}
+.footer a {
+    color: #667eea;
+    text-decoration: none;
+    font-weight: 600;
+}
+.chart-container {
+    background: white;
+    padding: 30px;
+    border-radius: 12px;
+    margin-bottom: 30px;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+}
+.detail-page .stat-card {
+    background: #f8f9fa;
+    padding: 20px;
+    box-shadow: none;
+}
+.detail-page .stat-value {
+    font-size: 2em;
+}
+.detail-page .stat-label {
+    text-transform: none;
+    letter-spacing: normal;
+}
+.detail-page .section-title {
+    font-size: 1.5em;
+    margin-bottom: 20px;
+}
+.detail-page .footer {
+    padding: 20px;
+    border-top: none;
+}
+"""
+
+# Fetches a <details data-src="..."> section's JSON sidecar the first time it is opened.
+# Sidecars are {"columns": [...], "rows": [[...], ...], "empty": "..."} with preformatted cells.
+REPORT_JS = """
+(function () {
+    'use strict';
+
+    function renderTable(data) {
+        var table = document.createElement('table');
+        var headRow = table.createTHead().insertRow();
+        data.columns.forEach(function (column) {
+            var th = document.createElement('th');
+            th.textContent = column;
+            headRow.appendChild(th);
+        });
+        var body = table.createTBody();
+        if (!data.rows.length) {
+            var cell = body.insertRow().insertCell();
+            cell.colSpan = data.columns.length;
+            cell.className = 'empty';
+            cell.textContent = data.empty || 'No data available';
+            return table;
+        }
+        data.rows.forEach(function (row) {
+            var tr = body.insertRow();
+            row.forEach(function (value, index) {
+                var td = tr.insertCell();
+                if (index === 0) {
+                    var strong = document.createElement('strong');
+                    strong.textContent = value;
+                    td.appendChild(strong);
+                } else {
+                    td.textContent = value;
+                }
+            });
+        });
+        return table;
+    }
+
+    function load(section) {
+        if (section.dataset.state) {
+            return;
+        }
+        section.dataset.state = 'loading';
+        var target = section.querySelector('.lazy-body');
+        fetch(section.dataset.src)
+            .then(function (response) {
+                if (!response.ok) {
+                    throw new Error('HTTP ' + response.status);
+                }
+                return response.json();
+            })
+            .then(function (data) {
+                target.replaceChildren(renderTable(data));
+                section.dataset.state = 'loaded';
+            })
+            .catch(function (error) {
+                target.textContent = 'Failed to load data: ' + error.message;
+                delete section.dataset.state;
+            });
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        document.querySelectorAll('details[data-src]').forEach(function (section) {
+            section.addEventListener('toggle', function () {
+                if (section.open) {
+                    load(section);
+                }
+            });
+            if (section.open) {
+                load(section);
+            }
+        });
+    });
+})();
+"""
+
 def load_summary(file_path):
     """Load k6 summary JSON file"""
     try:
@@ -45,7 +400,272 @@ def get_metric_value(metrics, metric_name, stat='avg'):
     except:
         return 0
 
-def generate_test_card(test_name, summary, file_name, error_msg=None):
+def format_offset(seconds):
+    """Format seconds since test start as +1h02m03s"""
+    seconds = int(seconds)
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours:
+        return f"+{hours}h{minutes:02d}m{secs:02d}s"
+    if minutes:
+        return f"+{minutes}m{secs:02d}s"
+    return f"+{secs}s"
+
+def parse_point_time(timestamp, minute_cache):
+    """Convert a k6 RFC 3339 timestamp to whole epoch seconds.
+
+    Only the minute prefix and UTC offset go through datetime; they are cached,
+    so the per-point cost is a slice and a dict lookup.
+    """
+    tz = '+00:00' if timestamp.endswith('Z') else timestamp[-6:]
+    key = (timestamp[:16], tz)
+    base = minute_cache.get(key)
+    if base is None:
+        base = int(datetime.fromisoformat(key[0] + tz).timestamp())
+        minute_cache[key] = base
+    return base + int(timestamp[17:19])
+
+def analyze_failed_requests(points_path, bucket_seconds=ERROR_BUCKET_SECONDS):
+    """Count failed requests exactly from a k6 --out json points file.
+
+    Each failing (status, error_code, endpoint) combination is interned to an
+    integer id on first sight; counts, first-seen times and per-bucket counts
+    are kept in flat tables indexed by that id instead of one dict per point.
+    """
+    combo_ids = {}
+    combo_keys = []
+    combo_counts = []
+    combo_first = []
+    combo_buckets = Counter()     # (combo id, bucket) -> failures
+    bucket_requests = Counter()   # bucket -> requests
+    bucket_failures = Counter()   # bucket -> failures
+    minute_cache = {}
+    total = 0
+    failed = 0
+    start = None
+
+    try:
+        with open(points_path, 'r') as f:
+            for line in f:
+                # Cheap substring filter before paying for json.loads
+                if '"http_req_failed"' not in line:
+                    continue
+                point = json.loads(line)
+                if point.get('type') != 'Point' or point.get('metric') != 'http_req_failed':
+                    continue
+
+                data = point['data']
+                epoch = parse_point_time(data['time'], minute_cache)
+                bucket = epoch // bucket_seconds
+                total += 1
+                bucket_requests[bucket] += 1
+                if start is None or epoch < start:
+                    start = epoch
+                if not data.get('value'):
+                    continue
+
+                tags = data.get('tags') or {}
+                endpoint = tags.get('name') or tags.get('url') or '-'
+                method = tags.get('method')
+                key = (
+                    tags.get('status') or '-',
+                    tags.get('error_code') or '-',
+                    f"{method} {endpoint}" if method else endpoint,
+                )
+                combo = combo_ids.get(key)
+                if combo is None:
+                    combo = combo_ids[key] = len(combo_keys)
+                    combo_keys.append(key)
+                    combo_counts.append(0)
+                    combo_first.append(epoch)
+                elif epoch < combo_first[combo]:
+                    combo_first[combo] = epoch
+
+                failed += 1
+                combo_counts[combo] += 1
+                combo_buckets[combo, bucket] += 1
+                bucket_failures[bucket] += 1
+    except Exception as e:
+        print(f"  ❌ Error reading points from {points_path}: {e}")
+        return None
+
+    # Busiest bucket per combination, from a single pass over the count table
+    combo_peak = {}
+    for (combo, bucket), count in combo_buckets.items():
+        peak = combo_peak.get(combo)
+        if peak is None or count > peak[1] or (count == peak[1] and bucket < peak[0]):
+            combo_peak[combo] = (bucket, count)
+
+    # Busiest combination per bucket, for the timeline
+    bucket_top = {}
+    for (combo, bucket), count in combo_buckets.items():
+        top = bucket_top.get(bucket)
+        if top is None or count > top[1]:
+            bucket_top[bucket] = (combo, count)
+
+    combos = [
+        {
+            'status': combo_keys[combo][0],
+            'error_code': combo_keys[combo][1],
+            'endpoint': combo_keys[combo][2],
+            'count': combo_counts[combo],
+            'first_seen': combo_first[combo],
+            'peak_bucket': combo_peak[combo][0],
+        }
+        for combo in sorted(range(len(combo_keys)), key=lambda c: (-combo_counts[c], combo_first[c]))
+    ]
+
+    print(f"  🔎 Counted {failed:,} failed of {total:,} requests in {points_path.name}")
+    return {
+        'total': total,
+        'failed': failed,
+        'start': start,
+        'bucket_seconds': bucket_seconds,
+        'combos': combos,
+        'timeline': [
+            {
+                'bucket': bucket,
+                'requests': bucket_requests[bucket],
+                'failures': bucket_failures[bucket],
+                'top': combo_keys[bucket_top[bucket][0]],
+            }
+            for bucket in sorted(bucket_failures)
+        ],
+    }
+
+def count_failed_requests(metrics, failures=None):
+    """Return exact (failed, total) request counts.
+
+    Prefers counts from the raw points; otherwise uses the passes/fails
+    counters k6 exports for rate metrics, where a "pass" of http_req_failed
+    is a failed request.
+    """
+    if failures:
+        return failures['failed'], failures['total']
+
+    failed_metric = metrics.get('http_req_failed', {})
+    values = failed_metric.get('values', failed_metric)
+    if 'passes' in values and 'fails' in values:
+        return int(values['passes']), int(values['passes'] + values['fails'])
+
+    # Last resort for summaries without counters
+    reqs = get_metric_value(metrics, 'http_reqs', 'count')
+    return round(get_metric_value(metrics, 'http_req_failed', 'rate') * reqs), int(reqs)
+
+def write_output(path, content):
+    """Write a generated file plus gzip (and brotli, if available) precompressed copies"""
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+    if path.suffix not in COMPRESSIBLE_SUFFIXES:
+        return
+    # mtime=0 keeps the .gz output byte-identical across runs for unchanged inputs
+    path.with_name(path.name + '.gz').write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        path.with_name(path.name + '.br').write_bytes(brotli.compress(data))
+
+def write_json(path, payload):
+    """Write a compact JSON sidecar"""
+    write_output(path, json.dumps(payload, separators=(',', ':'), ensure_ascii=False))
+
+def write_hashed_asset(docs_dir, stem, suffix, content):
+    """Write a content-hashed asset once and return its path relative to docs_dir"""
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:10]
+    assets_dir = docs_dir / 'assets'
+    assets_dir.mkdir(parents=True, exist_ok=True)
+    file_name = f"{stem}.{digest}{suffix}"
+
+    # Drop assets from previous builds so stale hashes don't accumulate
+    for old in assets_dir.glob(f"{stem}.*{suffix}*"):
+        if not old.name.startswith(file_name):
+            old.unlink()
+
+    if not (assets_dir / file_name).exists():
+        write_output(assets_dir / file_name, content)
+    return f"assets/{file_name}"
+
+def write_report_assets(docs_dir):
+    """Write the shared stylesheet and script, returning their hrefs"""
+    return {
+        'css': write_hashed_asset(docs_dir, 'report', '.css', REPORT_CSS),
+        'js': write_hashed_asset(docs_dir, 'report', '.js', REPORT_JS),
+    }
+
+def page_head(title, assets):
+    """Build the <head> block shared by every generated page"""
+    return f"""<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="stylesheet" href="{assets['css']}">
+    <script src="{assets['js']}" defer></script>
+</head>"""
+
+def write_failure_sidecars(docs_dir, slug, failures):
+    """Write the failed-request drilldown sidecars and return their lazy sections"""
+    failed = failures['failed']
+    start = failures['start'] or 0
+    width = failures['bucket_seconds']
+
+    def share(count):
+        return f"{count / failed * 100:.1f}%" if failed else "0.0%"
+
+    def window(bucket):
+        offset = bucket * width - start
+        return f"{format_offset(max(offset, 0))} – {format_offset(offset + width)}"
+
+    combos = failures['combos']
+    combination_rows = [
+        [combo['endpoint'], combo['status'], combo['error_code'], f"{combo['count']:,}",
+         share(combo['count']), format_offset(combo['first_seen'] - start), window(combo['peak_bucket'])]
+        for combo in combos[:ERROR_TOP_COMBINATIONS]
+    ]
+
+    # Per-dimension totals are rolled up from the combination table
+    breakdown_rows = []
+    for label, field in (('Status', 'status'), ('Error Code', 'error_code'), ('Endpoint', 'endpoint')):
+        totals = Counter()
+        for combo in combos:
+            totals[combo[field]] += combo['count']
+        breakdown_rows.extend(
+            [label, value, f"{count:,}", share(count)] for value, count in totals.most_common()
+        )
+
+    timeline_rows = [
+        [window(entry['bucket']), f"{entry['requests']:,}", f"{entry['failures']:,}",
+         f"{entry['failures'] / entry['requests'] * 100:.1f}%", ' · '.join(entry['top'])]
+        for entry in failures['timeline']
+    ]
+
+    sections = (
+        ('errors', 'Top Failing Requests', {
+            'columns': ['Endpoint', 'Status', 'Error Code', 'Failures', 'Share', 'First Seen', 'Busiest Window'],
+            'rows': combination_rows,
+        }),
+        ('error-breakdown', 'Failures by Category', {
+            'columns': ['Group', 'Value', 'Failures', 'Share'],
+            'rows': breakdown_rows,
+        }),
+        ('error-timeline', 'Failure Timeline', {
+            'columns': ['Window', 'Requests', 'Failures', 'Error Rate', 'Top Combination'],
+            'rows': timeline_rows,
+        }),
+    )
+
+    html = ""
+    for name, title, payload in sections:
+        data_path = f"data/{slug}-{name}.json"
+        payload['empty'] = 'No failed requests recorded'
+        write_json(docs_dir / data_path, payload)
+        html += f"""
+            <details class="section lazy-section" data-src="{data_path}">
+                <summary><h2 class="section-title">{title}</h2></summary>
+                <div class="lazy-body"><p class="lazy-status">Loading…</p></div>
+            </details>"""
+    return html
+
+def generate_test_card(test_name, summary, file_name, error_msg=None, failures=None):
     """Generate HTML for a single test card"""
     if not summary:
         error_text = error_msg if error_msg else "Test failed to complete or parse results"
@@ -65,7 +685,8 @@ def generate_test_card(test_name, summary, file_name, error_msg=None):
     http_reqs = get_metric_value(metrics, 'http_reqs', 'count')
     http_req_duration_avg = get_metric_value(metrics, 'http_req_duration', 'avg')
     http_req_duration_p95 = get_metric_value(metrics, 'http_req_duration', 'p(95)')
-    http_req_failed = get_metric_value(metrics, 'http_req_failed', 'rate')
+    failed_count, request_count = count_failed_requests(metrics, failures)
+    http_req_failed = failed_count / request_count if request_count else 0
     iterations = get_metric_value(metrics, 'iterations', 'count')
     vus_max = get_metric_value(metrics, 'vus_max', 'max')
     
@@ -100,7 +721,7 @@ def generate_test_card(test_name, summary, file_name, error_msg=None):
             </div>
             <div class="metric">
                 <span class="metric-label">Error Rate</span>
-                <span class="metric-value">{http_req_failed*100:.2f}%</span>
+                <span class="metric-value" title="{failed_count:,} failed">{http_req_failed*100:.2f}%</span>
             </div>
             <div class="metric">
                 <span class="metric-label">Iterations</span>
@@ -115,12 +736,13 @@ def generate_test_card(test_name, summary, file_name, error_msg=None):
     </div>
     """
 
-def generate_detail_page(test_name, summary, file_name, docs_dir):
+def generate_detail_page(test_name, summary, file_name, docs_dir, assets, failures=None):
     """Generate detailed HTML page for a single test"""
     if not summary:
         return
     
     metrics = summary.get('metrics', {})
+    slug = file_name.replace('-summary.json', '')
     
     # Helper to safely extract metric values
     def get_metric_dict(metric_name):
@@ -132,173 +754,43 @@ def generate_detail_page(test_name, summary, file_name, docs_dir):
             return metric_data.get('values', metric_data)
         return {}
     
-    # Extract all available metrics
-    http_req_duration = get_metric_dict('http_req_duration')
-    http_req_waiting = get_metric_dict('http_req_waiting')
-    http_req_connecting = get_metric_dict('http_req_connecting')
-    http_req_blocked = get_metric_dict('http_req_blocked')
-    http_req_sending = get_metric_dict('http_req_sending')
-    http_req_receiving = get_metric_dict('http_req_receiving')
-    iteration_duration = get_metric_dict('iteration_duration')
-    
     # Extract count/rate metrics
     http_reqs = get_metric_value(metrics, 'http_reqs', 'count')
-    http_req_failed = get_metric_value(metrics, 'http_req_failed', 'rate')
+    failed_count, request_count = count_failed_requests(metrics, failures)
+    http_req_failed = failed_count / request_count if request_count else 0
     iterations = get_metric_value(metrics, 'iterations', 'count')
     vus = get_metric_value(metrics, 'vus', 'value')
     vus_max = get_metric_value(metrics, 'vus_max', 'max')
     data_received = get_metric_value(metrics, 'data_received', 'count')
     data_sent = get_metric_value(metrics, 'data_sent', 'count')
     
-    # Build metrics table
-    metrics_rows = ""
-    
-    # Helper function to add metric row
-    def add_metric_row(name, values):
+    # Build timing rows for the lazily loaded metrics sidecar
+    metrics_rows = []
+    for name in ('http_req_duration', 'http_req_blocked', 'http_req_connecting',
+                 'http_req_sending', 'http_req_waiting', 'http_req_receiving',
+                 'iteration_duration'):
+        values = get_metric_dict(name)
         if values and any(values.values()):  # Check if dict has any non-zero values
-            return f"""
-        <tr>
-            <td><strong>{name}</strong></td>
-            <td>{format_duration(values.get('avg', 0))}</td>
-            <td>{format_duration(values.get('min', 0))}</td>
-            <td>{format_duration(values.get('med', 0))}</td>
-            <td>{format_duration(values.get('max', 0))}</td>
-            <td>{format_duration(values.get('p(90)', 0))}</td>
-            <td>{format_duration(values.get('p(95)', 0))}</td>
-        </tr>
-        """
-        return ""
-    
-    # Add all available metrics
-    metrics_rows += add_metric_row('http_req_duration', http_req_duration)
-    metrics_rows += add_metric_row('http_req_blocked', http_req_blocked)
-    metrics_rows += add_metric_row('http_req_connecting', http_req_connecting)
-    metrics_rows += add_metric_row('http_req_sending', http_req_sending)
-    metrics_rows += add_metric_row('http_req_waiting', http_req_waiting)
-    metrics_rows += add_metric_row('http_req_receiving', http_req_receiving)
-    metrics_rows += add_metric_row('iteration_duration', iteration_duration)
+            metrics_rows.append([name] + [
+                format_duration(values.get(stat, 0))
+                for stat in ('avg', 'min', 'med', 'max', 'p(90)', 'p(95)')
+            ])
     
-    # If no metrics rows, show a message
-    if not metrics_rows.strip():
-        metrics_rows = """
-        <tr>
-            <td colspan="7" style="text-align: center; color: #999;">
-                No detailed timing metrics available for this test
-            </td>
-        </tr>
-        """
+    metrics_data = f"data/{slug}-metrics.json"
+    write_json(docs_dir / metrics_data, {
+        'columns': ['Metric', 'Avg', 'Min', 'Med', 'Max', 'P90', 'P95'],
+        'rows': metrics_rows,
+        'empty': 'No detailed timing metrics available for this test',
+    })
+
+    error_sections = ""
+    if failures is not None:
+        error_sections = write_failure_sidecars(docs_dir, slug, failures)
     
     detail_html = f"""<!DOCTYPE html>
 <html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{test_name} - Details</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 16px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-        }}
-        .back-link {{
-            display: inline-block;
-            color: white;
-            text-decoration: none;
-            margin-bottom: 20px;
-            opacity: 0.9;
-        }}
-        .back-link:hover {{
-            opacity: 1;
-        }}
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }}
-        .content {{
-            padding: 40px;
-        }}
-        .section {{
-            margin-bottom: 40px;
-        }}
-        .section-title {{
-            font-size: 1.5em;
-            color: #333;
-            margin-bottom: 20px;
-            font-weight: 600;
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .stat-card {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 12px;
-            text-align: center;
-        }}
-        .stat-value {{
-            font-size: 2em;
-            font-weight: 700;
-            color: #667eea;
-            margin-bottom: 5px;
-        }}
-        .stat-label {{
-            color: #666;
-            font-size: 0.9em;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: white;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        th {{
-            background: #667eea;
-            color: white;
-            padding: 15px;
-            text-align: left;
-            font-weight: 600;
-        }}
-        td {{
-            padding: 12px 15px;
-            border-bottom: 1px solid #e0e0e0;
-        }}
-        tr:last-child td {{
-            border-bottom: none;
-        }}
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        .footer {{
-            background: #f8f9fa;
-            padding: 20px;
-            text-align: center;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
+{page_head(f"{test_name} - Details", assets)}
+<body class="detail-page">
     <div class="container">
         <div class="header">
             <a href="index.html" class="back-link">← Back to Overview</a>
@@ -317,6 +809,10 @@ def generate_detail_page(test_name, summary, file_name, docs_dir):
                         <div class="stat-value">{http_req_failed*100:.2f}%</div>
                         <div class="stat-label">Error Rate</div>
                     </div>
+                    <div class="stat-card">
+                        <div class="stat-value">{failed_count:,}</div>
+                        <div class="stat-label">Failed Requests</div>
+                    </div>
                     <div class="stat-card">
                         <div class="stat-value">{int(iterations):,}</div>
                         <div class="stat-label">Iterations</div>
@@ -336,29 +832,15 @@ def generate_detail_page(test_name, summary, file_name, docs_dir):
                 </div>
             </div>
             
-            <div class="section">
-                <h2 class="section-title">Detailed Metrics</h2>
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Metric</th>
-                            <th>Avg</th>
-                            <th>Min</th>
-                            <th>Med</th>
-                            <th>Max</th>
-                            <th>P90</th>
-                            <th>P95</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {metrics_rows}
-                    </tbody>
-                </table>
-            </div>
+            <details class="section lazy-section" data-src="{metrics_data}">
+                <summary><h2 class="section-title">Detailed Metrics</h2></summary>
+                <div class="lazy-body"><p class="lazy-status">Loading…</p></div>
+            </details>
+            {error_sections}
         </div>
         
         <div class="footer">
-            <a href="index.html" style="color: #667eea; text-decoration: none; font-weight: 600;">← Back to Overview</a>
+            <a href="index.html">← Back to Overview</a>
         </div>
     </div>
 </body>
@@ -366,9 +848,8 @@ def generate_detail_page(test_name, summary, file_name, docs_dir):
 """
     
     # Write detail page
-    detail_filename = file_name.replace('-summary.json', '') + '.html'
-    with open(docs_dir / detail_filename, 'w') as f:
-        f.write(detail_html)
+    detail_filename = slug + '.html'
+    write_output(docs_dir / detail_filename, detail_html)
     
     print(f"  ✓ Generated detail page: {detail_filename}")
 
@@ -377,6 +858,7 @@ def generate_html_report():
     results_dir = Path('test-results')
     docs_dir = Path('docs')
     docs_dir.mkdir(exist_ok=True)
+    assets = write_report_assets(docs_dir)
     
     # Load all test summaries
     tests = []
@@ -410,211 +892,31 @@ def generate_html_report():
                 print(f"  ⚠ Warning: {error_msg}")
         
         tests.append({'name': test_name, 'summary': summary, 'file': file_name})
-        test_cards_html += generate_test_card(test_name, summary, file_name, error_msg)
+        
+        # Raw points (k6 --out json) give exact failure counts and the drilldown
+        failures = None
+        points_path = results_dir / file_name.replace('-summary.json', '.json')
+        if summary and points_path.exists():
+            failures = analyze_failed_requests(points_path)
+
+        test_cards_html += generate_test_card(test_name, summary, file_name, error_msg, failures)
         
         # Generate detail page for each test
         if summary:
-            generate_detail_page(test_name, summary, file_name, docs_dir)
+            generate_detail_page(test_name, summary, file_name, docs_dir, assets, failures)
         
         if summary:
             metrics = summary.get('metrics', {})
             total_requests += get_metric_value(metrics, 'http_reqs', 'count')
-            failed_rate = get_metric_value(metrics, 'http_req_failed', 'rate')
-            reqs = get_metric_value(metrics, 'http_reqs', 'count')
-            total_errors += int(failed_rate * reqs)
+            failed_count, _ = count_failed_requests(metrics, failures)
+            total_errors += failed_count
     
     success_rate = ((total_requests - total_errors) / total_requests * 100) if total_requests > 0 else 0
     
     # Generate main HTML
     html_content = f"""<!DOCTYPE html>
 <html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>K6 Performance Test Results</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 16px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-        }}
-        .header h1 {{
-            font-size: 2.5em;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }}
-        .header .subtitle {{
-            font-size: 1.1em;
-            opacity: 0.9;
-        }}
-        .timestamp {{
-            background: rgba(255,255,255,0.2);
-            padding: 10px 20px;
-            border-radius: 8px;
-            margin-top: 20px;
-            display: inline-block;
-        }}
-        .stats-overview {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            padding: 40px;
-            background: #f8f9fa;
-        }}
-        .stat-card {{
-            background: white;
-            padding: 25px;
-            border-radius: 12px;
-            text-align: center;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .stat-value {{
-            font-size: 2.5em;
-            font-weight: 700;
-            color: #667eea;
-            margin-bottom: 5px;
-        }}
-        .stat-label {{
-            color: #666;
-            font-size: 0.9em;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        .content {{
-            padding: 40px;
-        }}
-        .section-title {{
-            font-size: 1.8em;
-            color: #333;
-            margin-bottom: 25px;
-            font-weight: 600;
-        }}
-        .test-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(400px, 1fr));
-            gap: 25px;
-            margin-bottom: 40px;
-        }}
-        .test-card {{
-            background: white;
-            border: 2px solid #e0e0e0;
-            border-radius: 12px;
-            padding: 25px;
-            transition: all 0.3s ease;
-        }}
-        .test-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 20px rgba(0,0,0,0.15);
-        }}
-        .test-card.success {{
-            border-color: #10b981;
-        }}
-        .test-card.warning {{
-            border-color: #f59e0b;
-        }}
-        .test-card.error {{
-            border-color: #ef4444;
-        }}
-        .test-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-        }}
-        .test-header h3 {{
-            font-size: 1.3em;
-            color: #333;
-        }}
-        .status-badge {{
-            padding: 6px 12px;
-            border-radius: 20px;
-            font-size: 0.85em;
-            font-weight: 600;
-        }}
-        .status-badge.success {{
-            background: #d1fae5;
-            color: #065f46;
-        }}
-        .status-badge.warning {{
-            background: #fef3c7;
-            color: #92400e;
-        }}
-        .status-badge.error {{
-            background: #fee2e2;
-            color: #991b1b;
-        }}
-        .test-metrics {{
-            display: grid;
-            grid-template-columns: repeat(3, 1fr);
-            gap: 15px;
-            margin-bottom: 15px;
-        }}
-        .metric {{
-            text-align: center;
-            padding: 10px;
-            background: #f8f9fa;
-            border-radius: 8px;
-        }}
-        .metric-label {{
-            display: block;
-            font-size: 0.75em;
-            color: #666;
-            margin-bottom: 5px;
-            text-transform: uppercase;
-        }}
-        .metric-value {{
-            display: block;
-            font-size: 1.3em;
-            font-weight: 700;
-            color: #333;
-        }}
-        .details-link {{
-            display: inline-block;
-            margin-top: 10px;
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-        }}
-        .details-link:hover {{
-            text-decoration: underline;
-        }}
-        .footer {{
-            background: #f8f9fa;
-            padding: 30px;
-            text-align: center;
-            color: #666;
-            border-top: 1px solid #e0e0e0;
-        }}
-        .footer a {{
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-        }}
-        .chart-container {{
-            background: white;
-            padding: 30px;
-            border-radius: 12px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-    </style>
-</head>
+{page_head("K6 Performance Test Results", assets)}
 <body>
     <div class="container">
         <div class="header">
@@ -639,7 +941,7 @@ def generate_html_report():
                 <div class="stat-label">Success Rate</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value">{total_errors}</div>
+                <div class="stat-value">{total_errors:,}</div>
                 <div class="stat-label">Failed Requests</div>
             </div>
         </div>
@@ -665,8 +967,7 @@ def generate_html_report():
 """
     
     # Write HTML file
-    with open(docs_dir / 'index.html', 'w') as f:
-        f.write(html_content)
+    write_output(docs_dir / 'index.html', html_content)
     
     print(f"✓ Generated report: {docs_dir / 'index.html'}")
     print(f"  Total tests: {len(tests)}")